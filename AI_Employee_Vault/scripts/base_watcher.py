@@ -7,13 +7,236 @@ All watchers (Gmail, WhatsApp, File System, etc.) inherit from this class
 to ensure consistent behavior across the AI Employee system.
 """
 
+import os
+import re
+import sys
+import math
 import time
+import queue
+import atexit
+import asyncio
+import hashlib
 import logging
 import json
+import sqlite3
+import functools
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
+
+
+# Characters not allowed in generated filenames (\w is any str.isalnum() char or '_')
+_UNSAFE_FN_CHARS = re.compile(r'[^\w-]')
+
+
+@functools.lru_cache(maxsize=1)
+def _filename_timestamp(epoch_second: int) -> str:
+    """Format a filename timestamp, reused for every file in the same second."""
+    return datetime.fromtimestamp(epoch_second).strftime('%Y-%m-%d_%H-%M-%S')
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+    
+    Answers "definitely not present" or "possibly present" using a compact
+    bit array instead of storing the keys themselves.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Initialize the filter.
+        
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, key: str) -> Iterator[int]:
+        """Yield bit positions for a key (Kirsch-Mitzenmacher double hashing)."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, key: str):
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# Windows priority class for background processing (lowers CPU and I/O priority)
+PROCESS_MODE_BACKGROUND_BEGIN = 0x00100000
+
+# Recently confirmed processed IDs kept in memory to skip database lookups
+PROCESSED_CACHE_SIZE = 10_000
+
+
+class ProcessedIds:
+    """
+    Set-like record of processed item IDs backed by the state database.
+    
+    Membership is answered by a Bloom filter first; possible hits are
+    confirmed against a small LRU of recent IDs and then a primary-key
+    lookup, so there are no false positives and memory stays bounded no
+    matter how many IDs are stored. New IDs are buffered until flush()
+    writes them.
+    """
+    
+    def __init__(self, db: sqlite3.Connection, capacity: int = 100_000,
+                 error_rate: float = 1e-7):
+        """
+        Initialize the store.
+        
+        Args:
+            db: Open state database containing the processed table
+            capacity: Initial Bloom filter capacity (doubled when exceeded)
+            error_rate: Bloom filter false positive rate
+        """
+        self._db = db
+        self._error_rate = error_rate
+        self._count = 0
+        self.pending: set = set()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._recent: 'OrderedDict[str, None]' = OrderedDict()
+    
+    def load(self):
+        """Build the Bloom filter from IDs already in the database."""
+        self._count = self._db.execute('SELECT COUNT(*) FROM processed').fetchone()[0]
+        self._rebuild(max(self._bloom.capacity, self._count * 2))
+    
+    def _rebuild(self, capacity: int):
+        """Recreate the Bloom filter at a new capacity."""
+        self._bloom = BloomFilter(capacity, self._error_rate)
+        for (item_id,) in self._db.execute('SELECT id FROM processed'):
+            self._bloom.add(item_id)
+        for item_id in self.pending:
+            self._bloom.add(item_id)
+    
+    def __contains__(self, item_id: str) -> bool:
+        if item_id not in self._bloom:
+            return False
+        if item_id in self.pending:
+            return True
+        if item_id in self._recent:
+            self._recent.move_to_end(item_id)
+            return True
+        row = self._db.execute('SELECT 1 FROM processed WHERE id = ?', (item_id,)).fetchone()
+        if row is None:
+            return False
+        self._remember(item_id)
+        return True
+    
+    def _remember(self, item_id: str):
+        """Add an ID to the recent-hit LRU, evicting the oldest."""
+        self._recent[item_id] = None
+        self._recent.move_to_end(item_id)
+        while len(self._recent) > PROCESSED_CACHE_SIZE:
+            self._recent.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def add(self, item_id: str):
+        """Record an item ID as processed."""
+        if item_id in self:
+            return
+        self.pending.add(item_id)
+        self._bloom.add(item_id)
+        self._count += 1
+        if self._count > self._bloom.capacity:
+            self._rebuild(self._bloom.capacity * 2)
+    
+    def flush(self):
+        """Write buffered IDs to the database."""
+        self._db.executemany(
+            'INSERT OR REPLACE INTO processed (id) VALUES (?)',
+            ((item_id,) for item_id in self.pending)
+        )
+        for item_id in self.pending:
+            self._remember(item_id)
+        self.pending.clear()
+
+
+def open_state_db(db_file: Path) -> sqlite3.Connection:
+    """
+    Open a SQLite state database with the processed and meta tables.
+    
+    The database runs in WAL mode so each save only appends the rows
+    that changed, instead of rewriting the whole state file.
+    
+    Args:
+        db_file: Path of the database file
+        
+    Returns:
+        Open connection in autocommit mode, usable from any thread
+    """
+    db = sqlite3.connect(str(db_file), isolation_level=None, check_same_thread=False)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.execute('CREATE TABLE IF NOT EXISTS processed (id TEXT PRIMARY KEY)')
+    db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+    return db
+
+
+def load_legacy_state(state_file: Path, logger: logging.Logger) -> Optional[Any]:
+    """
+    Read and retire a JSON state file written by older versions.
+    
+    Args:
+        state_file: Path of the legacy JSON file
+        logger: Logger for migration messages
+        
+    Returns:
+        Parsed JSON content, or None if there is no legacy file
+    """
+    if not state_file.exists():
+        return None
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+        state_file.rename(state_file.with_suffix('.json.migrated'))
+        logger.info('Migrated legacy state file: %s', state_file.name)
+        return state
+    except Exception as e:
+        logger.warning('Could not migrate state file %s: %s', state_file.name, e)
+        return None
+
+
+def save_processed_ids(db: sqlite3.Connection, processed_ids: ProcessedIds,
+                       logger: logging.Logger):
+    """
+    Persist processed IDs added since the last save in one transaction.
+    
+    Args:
+        db: Open state database
+        processed_ids: Store whose pending IDs should be written
+        logger: Logger for save errors
+    """
+    if not processed_ids.pending:
+        return
+    try:
+        with db:
+            db.execute('BEGIN')
+            db.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                ('last_updated', datetime.now().isoformat())
+            )
+            processed_ids.flush()
+    except Exception as e:
+        logger.error('Could not save state: %s', e)
 
 
 class BaseWatcher(ABC):
@@ -35,65 +258,101 @@ class BaseWatcher(ABC):
         self.vault_path = Path(vault_path)
         self.check_interval = check_interval
         self.running = False
-        self.processed_ids: set = set()
+        self._stop_event = threading.Event()
         
         # Define folder paths
         self.inbox_folder = self.vault_path / 'Inbox'
         self.needs_action_folder = self.vault_path / 'Needs_Action'
         self.logs_folder = self.vault_path / 'Logs'
+        self.state_folder = self.vault_path / 'scripts'
         
         # Ensure folders exist
         self.inbox_folder.mkdir(parents=True, exist_ok=True)
         self.needs_action_folder.mkdir(parents=True, exist_ok=True)
         self.logs_folder.mkdir(parents=True, exist_ok=True)
+        self.state_folder.mkdir(parents=True, exist_ok=True)
         
         # Setup logging
         self._setup_logging()
         
+        # Open persistent state store
+        self._open_state_db()
+        
         # Load previously processed IDs (for deduplication)
         self._load_processed_ids()
         
     def _setup_logging(self):
-        """Configure logging for this watcher."""
-        log_file = self.logs_folder / f'{self.__class__.__name__}.log'
+        """
+        Configure logging for this watcher.
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        Records are handed to a QueueListener so file I/O happens off the
+        watcher thread. Console output is only added when the
+        AIV_LOG_STDERR environment variable is set.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Handlers are attached once per logger, so further instances of the
+        # same watcher share them instead of duplicating every line
+        if self.logger.handlers:
+            return
+        
+        log_file = self.logs_folder / f'{self.__class__.__name__}.log'
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        handlers = [logging.FileHandler(log_file)]
+        if os.environ.get('AIV_LOG_STDERR', '').lower() not in ('', '0', 'false', 'no'):
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        
+    def _open_state_db(self):
+        """Open the SQLite state database for this watcher."""
+        self._db = open_state_db(self.state_folder / f'{self.__class__.__name__}_state.db')
+    
+    def _load_legacy_state(self, name: str) -> Optional[Any]:
+        """
+        Read and retire a JSON state file written by older versions.
+        
+        Args:
+            name: File name inside the scripts folder
+            
+        Returns:
+            Parsed JSON content, or None if there is no legacy file
+        """
+        return load_legacy_state(self.state_folder / name, self.logger)
+    
     def _load_processed_ids(self):
         """Load previously processed item IDs from disk."""
-        state_file = self.vault_path / 'scripts' / f'{self.__class__.__name__}_state.json'
-        if state_file.exists():
-            try:
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
-                    self.processed_ids = set(state.get('processed_ids', []))
-                    self.logger.info(f'Loaded {len(self.processed_ids)} previously processed IDs')
-            except Exception as e:
-                self.logger.warning(f'Could not load state file: {e}')
-                self.processed_ids = set()
-        else:
-            self.processed_ids = set()
+        self.processed_ids = ProcessedIds(self._db)
+        try:
+            self.processed_ids.load()
+            
+            legacy = self._load_legacy_state(f'{self.__class__.__name__}_state.json')
+            if legacy:
+                for item_id in legacy.get('processed_ids', []):
+                    self.processed_ids.add(item_id)
+                self._save_processed_ids()
+            
+            self.logger.info('Loaded %d previously processed IDs', len(self.processed_ids))
+        except Exception as e:
+            self.logger.warning('Could not load state: %s', e)
+    
+    def _save_processed_ids(self):
+        """Persist processed IDs added since the last save."""
+        save_processed_ids(self._db, self.processed_ids, self.logger)
             
     def _save_state(self):
         """Save current state to disk for persistence."""
-        state_file = self.vault_path / 'scripts' / f'{self.__class__.__name__}_state.json'
-        try:
-            state = {
-                'processed_ids': list(self.processed_ids),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-        except Exception as e:
-            self.logger.error(f'Could not save state: {e}')
+        self._save_processed_ids()
     
     @abstractmethod
     def check_for_updates(self) -> List[Dict[str, Any]]:
@@ -129,9 +388,9 @@ class BaseWatcher(ABC):
         Returns:
             Generated filename with .md extension
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        timestamp = _filename_timestamp(int(time.time()))
         # Sanitize identifier for filename
-        safe_id = ''.join(c if c.isalnum() or c in '-_' else '_' for c in identifier)
+        safe_id = _UNSAFE_FN_CHARS.sub('_', identifier)
         return f'{prefix}_{safe_id}_{timestamp}.md'
     
     def _create_metadata_file(self, action_file: Path, metadata: Dict[str, Any]):
@@ -147,7 +406,103 @@ class BaseWatcher(ABC):
             with open(meta_path, 'w') as f:
                 json.dump(metadata, f, indent=2)
         except Exception as e:
-            self.logger.warning(f'Could not create metadata file: {e}')
+            self.logger.warning('Could not create metadata file: %s', e)
+    
+    def _handle_items(self, items: List[Dict[str, Any]]):
+        """
+        Create action files for a batch of new items and save state.
+        
+        Args:
+            items: New items returned by a check
+        """
+        if items:
+            self.logger.info('Found %d new item(s) to process', len(items))
+            
+            for item in items:
+                try:
+                    action_file = self.create_action_file(item)
+                    if action_file:
+                        self.logger.info('Created action file: %s', action_file.name)
+                except Exception as e:
+                    self.logger.error('Error creating action file: %s', e)
+        
+        # Save state periodically
+        self._save_state()
+    
+    def _iter_updates(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of new items until the watcher is stopped.
+        
+        The default implementation polls check_for_updates every
+        check_interval seconds. Subclasses with an event source can
+        override this to yield batches as changes arrive.
+        
+        Yields:
+            List of new items per check
+        """
+        while self.running:
+            try:
+                yield self.check_for_updates()
+            except Exception as e:
+                self.logger.error('Error in check loop: %s', e)
+            
+            # Wait before next check (returns early on stop())
+            self._stop_event.wait(self.check_interval)
+    
+    async def _aiter_updates(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async counterpart of _iter_updates.
+        
+        Checks and waits run on worker threads so the event loop is not
+        blocked by file I/O.
+        
+        Yields:
+            List of new items per check
+        """
+        while self.running:
+            try:
+                yield await asyncio.to_thread(self.check_for_updates)
+            except Exception as e:
+                self.logger.error('Error in check loop: %s', e)
+            
+            # Wait before next check (returns early on stop())
+            await asyncio.to_thread(self._stop_event.wait, self.check_interval)
+    
+    def _lower_priority(self):
+        """
+        Run the watcher at background CPU and I/O priority.
+        
+        Scans should never compete with the user's foreground work. Any
+        failure is ignored; the watcher works the same at normal priority.
+        """
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetPriorityClass(kernel32.GetCurrentProcess(),
+                                          PROCESS_MODE_BACKGROUND_BEGIN)
+            except (OSError, AttributeError) as e:
+                self.logger.debug('Could not set background priority: %s', e)
+            return
+        
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, 19)
+        except (OSError, AttributeError) as e:
+            self.logger.debug('Could not lower CPU priority: %s', e)
+        
+        # Linux only; without an explicit ioprio, SCHED_IDLE tasks also get
+        # the idle I/O class, so this covers `ionice -c 3` as well
+        if hasattr(os, 'SCHED_IDLE'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            except OSError as e:
+                self.logger.debug('Could not set idle scheduling: %s', e)
+    
+    def _log_start(self):
+        """Log watcher configuration at startup."""
+        self.logger.info('Starting %s', self.__class__.__name__)
+        self.logger.info('Vault path: %s', self.vault_path)
+        self.logger.info('Check interval: %s seconds', self.check_interval)
     
     def run(self):
         """
@@ -156,46 +511,57 @@ class BaseWatcher(ABC):
         Continuously checks for updates and creates action files.
         """
         self.running = True
-        self.logger.info(f'Starting {self.__class__.__name__}')
-        self.logger.info(f'Vault path: {self.vault_path}')
-        self.logger.info(f'Check interval: {self.check_interval} seconds')
+        self._stop_event.clear()
+        self._lower_priority()
+        self._log_start()
         
         try:
-            while self.running:
+            for items in self._iter_updates():
+                if not self.running:
+                    break
+                
                 try:
-                    # Check for new items
-                    items = self.check_for_updates()
-                    
-                    if items:
-                        self.logger.info(f'Found {len(items)} new item(s) to process')
-                        
-                        for item in items:
-                            try:
-                                action_file = self.create_action_file(item)
-                                if action_file:
-                                    self.logger.info(f'Created action file: {action_file.name}')
-                            except Exception as e:
-                                self.logger.error(f'Error creating action file: {e}')
-                    
-                    # Save state periodically
-                    self._save_state()
-                    
+                    self._handle_items(items)
                 except Exception as e:
-                    self.logger.error(f'Error in check loop: {e}')
-                
-                # Wait before next check
-                time.sleep(self.check_interval)
+                    self.logger.error('Error in check loop: %s', e)
                 
         except KeyboardInterrupt:
             self.logger.info('Watcher stopped by user')
         finally:
             self.running = False
             self._save_state()
-            self.logger.info(f'{self.__class__.__name__} stopped')
+            self.logger.info('%s stopped', self.__class__.__name__)
+    
+    async def arun(self):
+        """
+        Async counterpart of run() for use inside an existing event loop.
+        
+        Blocking work (checks, hashing, copies, state writes) is pushed to
+        worker threads so co-running coroutines are never stalled.
+        """
+        self.running = True
+        self._stop_event.clear()
+        self._log_start()
+        
+        try:
+            async for items in self._aiter_updates():
+                if not self.running:
+                    break
+                
+                try:
+                    await asyncio.to_thread(self._handle_items, items)
+                except Exception as e:
+                    self.logger.error('Error in check loop: %s', e)
+                
+        finally:
+            self.running = False
+            self._save_state()
+            self.logger.info('%s stopped', self.__class__.__name__)
     
     def stop(self):
         """Stop the watcher."""
         self.running = False
+        self._stop_event.set()
         self.logger.info('Stop signal received')
 
 
@@ -12,18 +12,281 @@ Usage:
 """
 
 import os
+import re
 import sys
+import time
+import asyncio
 import hashlib
 import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from stat import S_ISREG, S_IWRITE
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Iterable, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from base_watcher import BaseWatcher
 
+# Kernel-level change notifications (optional - falls back to polling)
+try:
+    from watchfiles import watch, awatch, Change
+except ImportError:
+    watch = None
+    awatch = None
+
+# Change detection only needs a fast digest, not a cryptographic one.
+# Prefer the SIMD-accelerated native kernels when installed, falling back
+# to the standard library so the Bronze Tier keeps working without extras.
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    try:
+        from xxhash import xxh3_64 as _hasher
+    except ImportError:
+        _hasher = hashlib.blake2b
+
+# Read size for hashing (1 MiB amortizes per-chunk interpreter overhead)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Hash kernels release the GIL, so hashing scales across threads
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Maximum files submitted to the hash pool at once
+HASH_QUEUE_SIZE = HASH_WORKERS * 4
+
+# Files processed concurrently by the async event loop
+ASYNC_FILE_LIMIT = 8
+
+# Seconds a file's size and mtime must hold still before it is processed,
+# so files that are still being written are not picked up half-done
+FILE_SETTLE_SECONDS = 1.0
+
+# Event-loop wake-up (ms) for re-checking unsettled files and rescans
+SETTLE_POLL_MS = 250
+
+# File hash records kept in memory; the rest are read from the state database
+FILE_HASH_CACHE_SIZE = 100_000
+
+# Records of deleted files older than this (seconds) are forgotten
+FILE_HASH_TTL = 30 * 86400
+
+# Seconds between stale-record sweeps
+FILE_HASH_PRUNE_INTERVAL = 86400
+
+# File types whose leading bytes are read for preview and priority detection
+TEXT_EXTENSIONS = {'.txt', '.md', '.json', '.csv', '.log'}
+
+# Bytes read from the start of a text file (bounded raw read, no full decode)
+CONTENT_PEEK_BYTES = 1024
+
+# Single-pass keyword matching (optional - falls back to a compiled regex)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Ordering used to pick the strongest priority among keyword hits
+PRIORITY_RANK = {'low': 0, 'medium': 1, 'high': 2}
+PRIORITY_NAMES = ('low', 'medium', 'high')
+
+# Linux ioctl request for a reflink (copy-on-write clone) of a whole file
+FICLONE = 0x40049409
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy a file using the cheapest mechanism the platform supports.
+    
+    Tries a reflink (FICLONE, instant on BTRFS/XFS), then in-kernel copies
+    (copy_file_range, sendfile), then a regular userspace copy. File
+    metadata is copied afterwards, like shutil.copy2.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = False
+        
+        if fcntl is not None and sys.platform.startswith('linux'):
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                copied = True
+            except OSError:
+                pass
+        
+        kernel_copies = []
+        if hasattr(os, 'copy_file_range'):
+            kernel_copies.append(_copy_file_range)
+        if hasattr(os, 'sendfile'):
+            kernel_copies.append(_sendfile)
+        
+        for kernel_copy in kernel_copies:
+            if copied:
+                break
+            try:
+                offset = 0
+                while offset < size:
+                    sent = kernel_copy(src_fd, dst_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = True
+            except OSError:
+                # Unsupported for this filesystem pair; discard partial output
+                os.ftruncate(dst_fd, 0)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+        
+        if not copied:
+            fsrc.seek(0)
+            shutil.copyfileobj(fsrc, fdst)
+    
+    shutil.copystat(src, dst)
+
+
+def _unlink_read_only(path: Union[str, Path]):
+    """
+    Delete a file, clearing its read-only flag first where that is required.
+    
+    Args:
+        path: File to delete
+    """
+    try:
+        os.unlink(path)
+    except PermissionError:
+        # Windows refuses to delete read-only files
+        os.chmod(path, S_IWRITE)
+        os.unlink(path)
+
+
+def _stat_file(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path reported by a change event.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Stat result for a regular file, or None if it is gone or not a file
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Removed or renamed before we got to it
+        return None
+    return stat if S_ISREG(stat.st_mode) else None
+
+
+def _settle(pending: Dict[str, Tuple[Tuple[int, int], float]],
+            paths: Iterable[str]) -> List[Tuple[str, os.stat_result]]:
+    """
+    Track changed files until they stop changing.
+    
+    Args:
+        pending: Unsettled paths mapped to their last (size, mtime_ns) and
+            the monotonic time it was first seen; updated in place
+        paths: Paths that changed since the last call
+        
+    Returns:
+        (path, stat) pairs whose size and mtime have been stable for
+        FILE_SETTLE_SECONDS
+    """
+    for path in paths:
+        pending.setdefault(path, None)
+    
+    now = time.monotonic()
+    ready = []
+    for path, seen in list(pending.items()):
+        stat = _stat_file(path)
+        if stat is None:
+            del pending[path]
+            continue
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if seen is None or seen[0] != signature:
+            pending[path] = (signature, now)
+        elif now - seen[1] >= FILE_SETTLE_SECONDS:
+            del pending[path]
+            ready.append((path, stat))
+    return ready
+
+
+def _scan_folder(folder: str) -> List[Tuple[str, os.stat_result]]:
+    """
+    Enumerate candidate files in a folder in one readdir pass.
+    
+    Hidden and temporary files are dropped by name before they are
+    stat'ed, so ignored entries never cost a syscall.
+    
+    Args:
+        folder: Directory to scan (non-recursive)
+        
+    Returns:
+        (path, stat) pairs for regular files
+    """
+    with os.scandir(folder) as it:
+        return [(e.path, e.stat()) for e in it
+                if not e.name.startswith('.') and not e.name.endswith('.tmp')
+                and e.is_file(follow_symlinks=False)]
+
+
+# Markdown body of a file-drop action file, filled with str.format_map
+_ACTION_TEMPLATE = '''---
+type: file_drop
+source: {file_name}
+file_path: {file_path}
+file_size: {file_size} bytes
+file_type: {file_type}
+priority: {priority}
+detected: {detected}
+status: pending
+hash: {hash}
+---
+
+# File Drop for Processing
+
+## Source File
+- **Name:** {file_name}
+- **Size:** {file_size} bytes
+- **Type:** {file_type}
+- **Priority:** {priority_upper}
+
+## Content Preview
+```
+{content_preview}
+```
+
+## Suggested Actions
+- [ ] Review file content
+- [ ] Categorize file
+- [ ] Take appropriate action
+- [ ] Move to /Done when complete
+
+## Notes
+*Add any notes or observations here.*
+
+---
+*Auto-generated by FileSystemWatcher*
+'''
+
 
 class FileSystemWatcher(BaseWatcher):
     """
@@ -53,9 +316,13 @@ class FileSystemWatcher(BaseWatcher):
         # Ensure drop folder exists
         self.drop_folder.mkdir(parents=True, exist_ok=True)
         
-        # Track file hashes to detect new/modified files
-        self.file_hashes: Dict[str, str] = {}
+        # Track file size/mtime/hash to detect new/modified files
+        self.file_hashes: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._dirty_records: Dict[str, Dict[str, Any]] = {}
+        self._next_prune = time.monotonic()
         self._load_file_hashes()
+        self._hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS,
+                                             thread_name_prefix='hash')
         
         # Priority keywords for automatic classification
         self.priority_keywords = {
@@ -63,76 +330,448 @@ class FileSystemWatcher(BaseWatcher):
             'medium': ['invoice', 'payment', 'deadline', 'review'],
             'low': ['note', 'reference', 'info', 'FYI']
         }
+        self._build_priority_matcher()
         
-        self.logger.info(f'Drop folder: {self.drop_folder}')
+        # Content-addressed store backing the copy_<name> files in Inbox;
+        # bypassed once the Inbox filesystem turns out to lack hard links
+        self.blobs_folder = self.inbox_folder / '.blobs'
+        self._hard_links = True
+        
+        self.logger.info('Drop folder: %s', self.drop_folder)
     
     def _load_file_hashes(self):
-        """Load previously recorded file hashes."""
-        state_file = self.vault_path / 'scripts' / 'filesystem_watcher_hashes.json'
-        if state_file.exists():
-            try:
-                import json
-                with open(state_file, 'r') as f:
-                    self.file_hashes = json.load(f)
-                    self.logger.info(f'Loaded {len(self.file_hashes)} file hashes')
-            except Exception as e:
-                self.logger.warning(f'Could not load file hashes: {e}')
-                self.file_hashes = {}
+        """
+        Prepare the file hash store.
+        
+        Records live in the state database; only the most recently used
+        FILE_HASH_CACHE_SIZE are kept in memory and misses are read through.
+        """
+        try:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS file_hashes '
+                '(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT)'
+            )
+            
+            legacy = self._load_legacy_state('filesystem_watcher_hashes.json')
+            if legacy:
+                for path, record in legacy.items():
+                    if isinstance(record, dict):
+                        self._put_record(path, record)
+                    else:
+                        self._seed_legacy_record(path, record)
+                self._save_file_hashes()
+            
+            count = self._db.execute('SELECT COUNT(*) FROM file_hashes').fetchone()[0]
+            self.logger.info('Loaded %d file hashes', count)
+        except Exception as e:
+            self.logger.warning('Could not load file hashes: %s', e)
+    
+    def _seed_legacy_record(self, path: str, legacy_md5: str):
+        """
+        Carry over a bare MD5 entry from the original hash file.
+        
+        A file whose content still matches the stored MD5 gets a record
+        with its current stat and digest, so it is not reported as new
+        after an upgrade. Changed or missing files are left unrecorded.
+        
+        Args:
+            path: File path as a string
+            legacy_md5: MD5 hex digest stored by older versions
+        """
+        try:
+            stat = os.stat(path)
+            md5 = hashlib.md5()
+            hasher = _hasher()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    md5.update(chunk)
+                    hasher.update(chunk)
+        except OSError:
+            return
+        
+        if md5.hexdigest() == legacy_md5:
+            self._put_record(path, {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': hasher.hexdigest()
+            })
+    
+    def _get_record(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the stored hash record for a path.
+        
+        Args:
+            path: File path as a string
+            
+        Returns:
+            Record dict with size, mtime_ns and hash, or None if unknown
+        """
+        record = self.file_hashes.get(path)
+        if record is not None:
+            self.file_hashes.move_to_end(path)
+            return record
+        
+        record = self._dirty_records.get(path)
+        if record is None:
+            row = self._db.execute(
+                'SELECT size, mtime_ns, hash FROM file_hashes WHERE path = ?', (path,)
+            ).fetchone()
+            if row is None:
+                return None
+            record = {'size': row[0], 'mtime_ns': row[1], 'hash': row[2]}
+        
+        self._cache_record(path, record)
+        return record
+    
+    def _cache_record(self, path: str, record: Dict[str, Any]):
+        """Insert a record into the in-memory LRU, evicting the oldest."""
+        self.file_hashes[path] = record
+        self.file_hashes.move_to_end(path)
+        while len(self.file_hashes) > FILE_HASH_CACHE_SIZE:
+            self.file_hashes.popitem(last=False)
+    
+    def _put_record(self, path: str, record: Dict[str, Any]):
+        """Store a record in memory and queue it for the next save."""
+        self._cache_record(path, record)
+        self._dirty_records[path] = record
     
     def _save_file_hashes(self):
-        """Save current file hashes to disk."""
-        state_file = self.vault_path / 'scripts' / 'filesystem_watcher_hashes.json'
+        """Persist file hash records changed since the last save."""
+        if not self._dirty_records:
+            return
+        try:
+            rows = [(path, record['size'], record['mtime_ns'], record['hash'])
+                    for path, record in self._dirty_records.items()]
+            
+            with self._db:
+                self._db.execute('BEGIN')
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, hash) '
+                    'VALUES (?, ?, ?, ?)',
+                    rows
+                )
+            self._dirty_records.clear()
+        except Exception as e:
+            self.logger.error('Could not save file hashes: %s', e)
+    
+    def _prune_file_hashes(self):
+        """
+        Forget records of deleted files unchanged for over FILE_HASH_TTL.
+        
+        Runs at most once per FILE_HASH_PRUNE_INTERVAL seconds, together
+        with the sweep of unreferenced Inbox blobs.
+        """
+        if time.monotonic() < self._next_prune:
+            return
+        self._next_prune = time.monotonic() + FILE_HASH_PRUNE_INTERVAL
+        
+        self._sweep_blobs()
+        
         try:
-            import json
-            with open(state_file, 'w') as f:
-                json.dump(self.file_hashes, f, indent=2)
+            cutoff_ns = time.time_ns() - FILE_HASH_TTL * 1_000_000_000
+            rows = self._db.execute(
+                'SELECT path FROM file_hashes WHERE mtime_ns < ?', (cutoff_ns,)
+            ).fetchall()
+            stale = [(path,) for (path,) in rows
+                     if path not in self._dirty_records and not os.path.exists(path)]
+            if not stale:
+                return
+            
+            with self._db:
+                self._db.execute('BEGIN')
+                self._db.executemany('DELETE FROM file_hashes WHERE path = ?', stale)
+            for (path,) in stale:
+                self.file_hashes.pop(path, None)
+            self.logger.info('Pruned %d stale file hashes', len(stale))
+        except Exception as e:
+            self.logger.error('Could not prune file hashes: %s', e)
+    
+    def _sweep_blobs(self):
+        """
+        Delete blobs that no Inbox alias links to any more.
+        
+        An alias is a hard link to its blob, so a blob whose link count
+        has dropped to one is only referenced by the store itself.
+        """
+        if not self.blobs_folder.is_dir():
+            return
+        
+        removed = 0
+        try:
+            for shard in os.scandir(self.blobs_folder):
+                if not shard.is_dir(follow_symlinks=False):
+                    continue
+                for entry in os.scandir(shard.path):
+                    # DirEntry.stat() leaves st_nlink at 0 on Windows
+                    if entry.is_file(follow_symlinks=False) and os.stat(entry.path).st_nlink == 1:
+                        _unlink_read_only(entry.path)
+                        removed += 1
         except Exception as e:
-            self.logger.error(f'Could not save file hashes: {e}')
+            self.logger.error('Could not sweep Inbox blobs: %s', e)
+        
+        if removed:
+            self.logger.info('Removed %d unreferenced Inbox blobs', removed)
     
-    def _calculate_hash(self, file_path: Path) -> str:
+    def _scan_file(self, path: str) -> Tuple[str, bytes]:
         """
-        Calculate MD5 hash of a file.
+        Hash a file and capture its leading bytes in a single read pass.
+        
+        Uses BLAKE3 or xxh3 when available, otherwise BLAKE2b. The leading
+        bytes are only kept for text files, for preview and priority
+        detection.
         
         Args:
-            file_path: Path to the file
+            path: Path to the file
             
         Returns:
-            MD5 hash string
+            Tuple of (hex digest, leading bytes); ('', b'') if unreadable
         """
-        hash_md5 = hashlib.md5()
+        hasher = _hasher()
+        head = b''
+        keep_head = os.path.splitext(path)[1] in TEXT_EXTENSIONS
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    if keep_head and not head:
+                        head = chunk[:CONTENT_PEEK_BYTES]
+                    hasher.update(chunk)
+            return hasher.hexdigest(), head
         except Exception as e:
-            self.logger.error(f'Error calculating hash for {file_path}: {e}')
-            return ''
+            self.logger.error('Error calculating hash for %s: %s', path, e)
+            return '', b''
     
-    def _detect_priority(self, filename: str, content: str = '') -> str:
+    def _build_priority_matcher(self):
+        """
+        Compile the priority keywords into a single-pass matcher.
+        
+        Keywords are matched as lowercased bytes against the raw file
+        head, so content never needs decoding or Unicode case folding.
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise one regex alternation. Only keywords that raise the
+        priority above the 'low' default are included.
+        """
+        self._keyword_rank: Dict[bytes, int] = {}
+        for priority in ('medium', 'high'):
+            for keyword in self.priority_keywords[priority]:
+                self._keyword_rank[keyword.lower().encode('utf-8')] = PRIORITY_RANK[priority]
+        
+        self._priority_automaton = None
+        self._priority_pattern = None
+        if ahocorasick is not None:
+            # The automaton takes str; latin-1 maps each byte to one char
+            automaton = ahocorasick.Automaton()
+            for keyword, rank in self._keyword_rank.items():
+                automaton.add_word(keyword.decode('latin-1'), rank)
+            automaton.make_automaton()
+            self._priority_automaton = automaton
+        else:
+            # Lookahead so overlapping keywords are all reported, like `in`
+            alternation = b'|'.join(re.escape(k) for k in self._keyword_rank)
+            self._priority_pattern = re.compile(b'(?=(' + alternation + b'))')
+    
+    def _detect_priority(self, filename: str, content: bytes = b'') -> str:
         """
         Detect priority level based on filename and content.
         
         Args:
             filename: Name of the file
-            content: Optional content to analyze
+            content: Optional leading bytes of the file to analyze
             
         Returns:
             Priority level: 'high', 'medium', or 'low'
         """
-        text = f'{filename} {content}'.lower()
+        text = b'%s %s' % (filename.encode('utf-8', 'surrogateescape'), content)
+        text = text.lower()
         
-        # Check for high priority keywords
-        for keyword in self.priority_keywords['high']:
-            if keyword in text:
-                return 'high'
+        if self._priority_automaton is not None:
+            hits = (rank for _, rank in self._priority_automaton.iter(text.decode('latin-1')))
+        else:
+            hits = (self._keyword_rank[m.group(1)]
+                    for m in self._priority_pattern.finditer(text))
         
-        # Check for medium priority keywords
-        for keyword in self.priority_keywords['medium']:
-            if keyword in text:
-                return 'medium'
+        best = PRIORITY_RANK['low']
+        for rank in hits:
+            if rank > best:
+                best = rank
+                if best == PRIORITY_RANK['high']:
+                    break
         
-        return 'low'
+        return PRIORITY_NAMES[best]
+    
+    def _should_hash(self, path: str, stat: os.stat_result) -> bool:
+        """
+        Decide whether a file needs hashing.
+        
+        Args:
+            path: Path to the file
+            stat: Stat result for the file
+            
+        Returns:
+            False for ignored files and files whose size and mtime are
+            unchanged since they were last hashed, True otherwise
+        """
+        # Skip hidden files and temporary files
+        if os.path.basename(path).startswith('.') or path.endswith('.tmp'):
+            return False
+        
+        # Skip hashing entirely when size and mtime are unchanged
+        record = self._get_record(path)
+        if (record and record.get('size') == stat.st_size
+                and record.get('mtime_ns') == stat.st_mtime_ns):
+            return False
+        
+        return True
+    
+    def _hash_files(self, candidates: List[Tuple[str, os.stat_result]]
+                    ) -> Iterator[Tuple[str, os.stat_result, str, bytes]]:
+        """
+        Hash files on the worker pool, yielding results as they complete.
+        
+        At most HASH_QUEUE_SIZE files are in flight at once so a very large
+        drop folder does not queue every file up front.
+        
+        Args:
+            candidates: (path, stat) pairs to hash
+            
+        Yields:
+            (path, stat, hash, leading bytes) tuples; hash is '' if the
+            file could not be read
+        """
+        in_flight = {}
+        for candidate in candidates:
+            if len(in_flight) >= HASH_QUEUE_SIZE:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, stat = in_flight.pop(future)
+                    yield (path, stat, *future.result())
+            future = self._hash_pool.submit(self._scan_file, candidate[0])
+            in_flight[future] = candidate
+        
+        for future in as_completed(in_flight):
+            path, stat = in_flight[future]
+            yield (path, stat, *future.result())
+    
+    def _record_file(self, path: str, stat: os.stat_result,
+                     current_hash: str, head: bytes = b'') -> Optional[Dict[str, Any]]:
+        """
+        Store a file's hash record and classify it if its content changed.
+        
+        Args:
+            path: Path to the file
+            stat: Stat result the hash was computed against
+            current_hash: Content hash of the file
+            head: Leading bytes of the file captured while hashing
+            
+        Returns:
+            File information dictionary if the file is new or modified,
+            otherwise None
+        """
+        record = self._get_record(path)
+        
+        # Update stored record (also refreshes mtime on touch-only changes)
+        self._put_record(path, {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': current_hash
+        })
+        
+        # Check if file is new or modified
+        if record and record.get('hash') == current_hash:
+            return None
+        
+        # New or modified file detected
+        file_name = os.path.basename(path)
+        self.logger.info('New/modified file detected: %s', file_name)
+        
+        # Detect priority from the filename first; only scan the leading
+        # bytes (text files only) if the name leaves the default priority
+        priority = self._detect_priority(file_name)
+        if priority == 'low' and head:
+            priority = self._detect_priority(file_name, head)
+        
+        content = head.decode('utf-8', 'ignore')
+        
+        return {
+            'file_path': path,
+            'file_name': file_name,
+            'file_size': stat.st_size,
+            'file_type': os.path.splitext(file_name)[1],
+            'hash': current_hash,
+            'previous_hash': record.get('hash', '') if record else '',
+            'priority': priority,
+            'content_preview': content[:200] if content else ''
+        }
+    
+    def _process_files(self, files: List[Tuple[str, os.stat_result]]) -> List[Dict[str, Any]]:
+        """
+        Hash and classify a batch of drop-folder files.
+        
+        Args:
+            files: (path, stat) pairs for regular files
+            
+        Returns:
+            List of new file information dictionaries
+        """
+        candidates = [(p, st) for p, st in files if self._should_hash(p, st)]
+        
+        new_files = []
+        for path, stat, current_hash, head in self._hash_files(candidates):
+            if not current_hash:
+                continue
+            item = self._record_file(path, stat, current_hash, head)
+            if item:
+                new_files.append(item)
+        
+        return new_files
+    
+    async def _process_path_async(self, file_path: Union[str, Path], stat: os.stat_result,
+                                  limit: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """
+        Hash and classify a single drop-folder file from the event loop.
+        
+        The hash pass runs on a worker thread (at most ASYNC_FILE_LIMIT at
+        once); the hash record is only written on the event loop thread,
+        so concurrent calls do not race on it.
+        
+        Args:
+            file_path: Path to a file already filtered by _ready_files
+            stat: Stat result the file settled with
+            limit: Semaphore bounding concurrent file work, created on the
+                running event loop
+            
+        Returns:
+            File information dictionary if the file is new or modified,
+            otherwise None
+        """
+        path = os.fspath(file_path)
+        async with limit:
+            current_hash, head = await asyncio.to_thread(self._scan_file, path)
+        
+        if not current_hash:
+            return None
+        
+        return self._record_file(path, stat, current_hash, head)
+    
+    def _ready_files(self, pending: Dict[str, Tuple[Tuple[int, int], float]],
+                     paths: Set[str], rescan: bool) -> List[Tuple[str, os.stat_result]]:
+        """
+        Settle changed paths and keep the files that may need hashing.
+        
+        Hash records are read here, so _aiter_updates runs this on a worker
+        thread; calls are never concurrent, so the record cache is safe.
+        
+        Args:
+            pending: Unsettled paths, see _settle; updated in place
+            paths: Paths reported changed since the last call
+            rescan: Also rescan the whole drop folder
+            
+        Returns:
+            (path, stat) pairs that have settled and are new or changed
+        """
+        if rescan:
+            paths.update(p for p, st in _scan_folder(str(self.drop_folder))
+                         if self._should_hash(p, st))
+        return [(p, st) for p, st in _settle(pending, paths) if self._should_hash(p, st)]
     
     def check_for_updates(self) -> List[Dict[str, Any]]:
         """
@@ -144,57 +783,209 @@ class FileSystemWatcher(BaseWatcher):
         new_files = []
         
         try:
-            # Get all files in drop folder
-            files = [f for f in self.drop_folder.iterdir() if f.is_file()]
+            new_files = self._process_files(_scan_folder(str(self.drop_folder)))
             
-            for file_path in files:
-                # Skip hidden files and temporary files
-                if file_path.name.startswith('.') or file_path.suffix == '.tmp':
-                    continue
+        except Exception as e:
+            self.logger.error('Error checking drop folder: %s', e)
+        
+        return new_files
+    
+    def _iter_updates(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of new items from filesystem change events.
+        
+        Uses watchfiles (inotify/FSEvents/ReadDirectoryChangesW) when
+        installed, otherwise falls back to polling every check_interval.
+        Changed files are held back until they have settled, and the drop
+        folder is still rescanned every check_interval as a safety net.
+        
+        Yields:
+            List of new file information dictionaries per batch
+        """
+        if watch is None:
+            yield from super()._iter_updates()
+            return
+        
+        self.logger.info('Using filesystem events (watchfiles)')
+        
+        pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        next_rescan = 0.0
+        
+        # The first wake-up comes after the watch is registered, so the
+        # catch-up scan below cannot miss files dropped while it runs
+        for changes in watch(self.drop_folder, stop_event=self._stop_event,
+                             debounce=200, step=50, recursive=False,
+                             rust_timeout=SETTLE_POLL_MS, yield_on_timeout=True):
+            paths = {path for change, path in changes if change != Change.deleted}
+            
+            new_files = []
+            try:
+                now = time.monotonic()
+                rescan = now >= next_rescan
+                if rescan:
+                    next_rescan = now + self.check_interval
                 
-                # Calculate hash
-                current_hash = self._calculate_hash(file_path)
-                if not current_hash:
+                ready = self._ready_files(pending, paths, rescan)
+                if not ready:
                     continue
+                new_files = self._process_files(ready)
+            except Exception as e:
+                self.logger.error('Error processing changes: %s', e)
+            yield new_files
+    
+    async def _aiter_updates(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async counterpart of _iter_updates using watchfiles.awatch.
+        
+        Falls back to thread-backed polling when watchfiles is not installed.
+        
+        Yields:
+            List of new file information dictionaries per batch
+        """
+        if awatch is None:
+            async for items in super()._aiter_updates():
+                yield items
+            return
+        
+        self.logger.info('Using filesystem events (watchfiles)')
+        
+        # Created here rather than in __init__: a semaphore is bound to the
+        # event loop it is first contended on, and arun() may be called
+        # again from a new loop
+        limit = asyncio.Semaphore(ASYNC_FILE_LIMIT)
+        
+        pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        next_rescan = 0.0
+        
+        # The first wake-up comes after the watch is registered, so the
+        # catch-up scan below cannot miss files dropped while it runs
+        async for changes in awatch(self.drop_folder, stop_event=self._stop_event,
+                                    debounce=200, step=50, recursive=False,
+                                    rust_timeout=SETTLE_POLL_MS, yield_on_timeout=True):
+            paths = {path for change, path in changes if change != Change.deleted}
+            
+            try:
+                now = time.monotonic()
+                rescan = now >= next_rescan
+                if rescan:
+                    next_rescan = now + self.check_interval
                 
-                # Check if file is new or modified
-                stored_hash = self.file_hashes.get(str(file_path))
-                
-                if stored_hash != current_hash:
-                    # New or modified file detected
-                    self.logger.info(f'New/modified file detected: {file_path.name}')
-                    
-                    # Read file content (if text file)
-                    content = ''
-                    try:
-                        if file_path.suffix in ['.txt', '.md', '.json', '.csv', '.log']:
-                            content = file_path.read_text(errors='ignore')[:1000]  # First 1000 chars
-                    except Exception as e:
-                        self.logger.warning(f'Could not read file content: {e}')
-                    
-                    # Detect priority
-                    priority = self._detect_priority(file_path.name, content)
-                    
-                    new_files.append({
-                        'file_path': str(file_path),
-                        'file_name': file_path.name,
-                        'file_size': file_path.stat().st_size,
-                        'file_type': file_path.suffix,
-                        'hash': current_hash,
-                        'priority': priority,
-                        'content_preview': content[:200] if content else ''
-                    })
-                    
-                    # Update stored hash
-                    self.file_hashes[str(file_path)] = current_hash
+                ready = await asyncio.to_thread(self._ready_files, pending, paths, rescan)
+            except Exception as e:
+                self.logger.error('Error processing changes: %s', e)
+                continue
+            if not ready:
+                continue
             
-            # Save updated hashes
-            self._save_file_hashes()
+            results = await asyncio.gather(
+                *(self._process_path_async(p, st, limit) for p, st in ready), return_exceptions=True
+            )
             
-        except Exception as e:
-            self.logger.error(f'Error checking drop folder: {e}')
+            new_files = []
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error('Error processing changes: %s', result)
+                elif result:
+                    new_files.append(result)
+            yield new_files
+    
+    def _save_state(self):
+        """Save processed IDs and file hashes to disk."""
+        super()._save_state()
+        self._save_file_hashes()
+        self._prune_file_hashes()
+    
+    def _store_blob(self, src: str) -> Path:
+        """
+        Copy a file into the Inbox blob store, keyed by its content hash.
         
-        return new_files
+        The copy goes through _fast_copy (reflink or in-kernel copy where
+        supported) and the copy itself is hashed, so the key always matches
+        the stored content even if the source changed after it was detected.
+        Blobs are made read-only because aliases share their inode.
+        
+        Args:
+            src: Path of the source file
+            
+        Returns:
+            Path to the stored blob
+        """
+        self.blobs_folder.mkdir(parents=True, exist_ok=True)
+        
+        # Copy under a temporary name so a crash never leaves a partial blob
+        fd, tmp_name = tempfile.mkstemp(suffix='.tmp', dir=self.blobs_folder)
+        os.close(fd)
+        try:
+            _fast_copy(src, tmp_name)
+            file_hash, _ = self._scan_file(tmp_name)
+            if not file_hash:
+                raise OSError(f'could not hash copy of {src}')
+            
+            blob_file = self.blobs_folder / file_hash[:2] / file_hash
+            if blob_file.exists():
+                os.unlink(tmp_name)
+            else:
+                blob_file.parent.mkdir(exist_ok=True)
+                os.chmod(tmp_name, 0o444)
+                os.replace(tmp_name, blob_file)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return blob_file
+    
+    def _remove_alias(self, dest_file: Path, previous_hash: str = ''):
+        """
+        Delete an Inbox alias, and its blob if nothing else links to it.
+        
+        Args:
+            dest_file: Alias path to remove
+            previous_hash: Hash of the content the alias was created for;
+                if empty, an orphaned blob is left to _sweep_blobs
+        """
+        if not (dest_file.is_symlink() or dest_file.exists()):
+            return
+        _unlink_read_only(dest_file)
+        
+        if not previous_hash:
+            return
+        blob_file = self.blobs_folder / previous_hash[:2] / previous_hash
+        try:
+            if os.stat(blob_file).st_nlink == 1:
+                _unlink_read_only(blob_file)
+            else:
+                # Clearing the alias's read-only flag also cleared the blob's
+                os.chmod(blob_file, 0o444)
+        except FileNotFoundError:
+            pass
+    
+    def _copy_to_inbox(self, src: str, dest_file: Path):
+        """
+        Place the reference copy of a dropped file in Inbox.
+        
+        Text files stay editable in Obsidian, so they get a plain copy.
+        Other files become read-only hard links into the blob store, so
+        identical drops share storage and an edit to one alias cannot
+        change the others. Where the filesystem has no hard links (FAT,
+        exFAT, many SMB shares) every file is copied straight to Inbox.
+        
+        Args:
+            src: Path of the source file
+            dest_file: Alias path to create (must not exist)
+        """
+        if not self._hard_links or dest_file.suffix.lower() in TEXT_EXTENSIONS:
+            _fast_copy(src, str(dest_file))
+            return
+        
+        blob_file = self._store_blob(src)
+        try:
+            os.link(blob_file, dest_file)
+        except OSError as e:
+            self._hard_links = False
+            self.logger.info('Hard links unavailable in Inbox (%s); copying files instead', e)
+            if os.stat(blob_file).st_nlink == 1:
+                _unlink_read_only(blob_file)
+            _fast_copy(src, str(dest_file))
     
     def create_action_file(self, item: Dict[str, Any]) -> Optional[Path]:
         """
@@ -212,61 +1003,34 @@ class FileSystemWatcher(BaseWatcher):
             action_file = self.needs_action_folder / filename
             
             # Create action file content
-            content = f'''---
-type: file_drop
-source: {item['file_name']}
-file_path: {item['file_path']}
-file_size: {item['file_size']} bytes
-file_type: {item['file_type']}
-priority: {item['priority']}
-detected: {datetime.now().isoformat()}
-status: pending
-hash: {item['hash']}
----
-
-# File Drop for Processing
-
-## Source File
-- **Name:** {item['file_name']}
-- **Size:** {item['file_size']} bytes
-- **Type:** {item['file_type']}
-- **Priority:** {item['priority'].upper()}
-
-## Content Preview
-```
-{item['content_preview'] if item['content_preview'] else '(Binary file or could not read)'}
-```
-
-## Suggested Actions
-- [ ] Review file content
-- [ ] Categorize file
-- [ ] Take appropriate action
-- [ ] Move to /Done when complete
-
-## Notes
-*Add any notes or observations here.*
-
----
-*Auto-generated by FileSystemWatcher*
-'''
+            content = _ACTION_TEMPLATE.format_map({
+                'file_name': item['file_name'],
+                'file_path': item['file_path'],
+                'file_size': item['file_size'],
+                'file_type': item['file_type'],
+                'priority': item['priority'],
+                'priority_upper': item['priority'].upper(),
+                'detected': datetime.now().isoformat(),
+                'hash': item['hash'],
+                'content_preview': item['content_preview'] or '(Binary file or could not read)'
+            })
             
             # Write action file
-            action_file.write_text(content)
+            action_file.write_bytes(content.encode('utf-8'))
             
             # Copy source file to vault for reference
             try:
-                dest_folder = self.vault_path / 'Inbox'
-                dest_folder.mkdir(parents=True, exist_ok=True)
-                dest_file = dest_folder / f'copy_{item["file_name"]}'
-                shutil.copy2(item['file_path'], dest_file)
-                self.logger.info(f'Copied source file to {dest_file}')
+                dest_file = self.inbox_folder / f'copy_{item["file_name"]}'
+                self._remove_alias(dest_file, item.get('previous_hash', ''))
+                self._copy_to_inbox(item['file_path'], dest_file)
+                self.logger.info('Copied source file to %s', dest_file)
             except Exception as e:
-                self.logger.warning(f'Could not copy source file: {e}')
+                self.logger.warning('Could not copy source file: %s', e)
             
             return action_file
             
         except Exception as e:
-            self.logger.error(f'Error creating action file: {e}')
+            self.logger.error('Error creating action file: %s', e)
             return None
 
 
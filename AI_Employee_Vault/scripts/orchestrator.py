@@ -15,15 +15,97 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import time
+import functools
 import logging
-import subprocess
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Callable
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from base_watcher import ProcessedIds, open_state_db, load_legacy_state, save_processed_ids
+
+# Kernel-level change notifications (optional - falls back to polling)
+try:
+    from watchfiles import watch
+except ImportError:
+    watch = None
+
+# Rewrite an unchanged dashboard at most this often (seconds), so Last Sync
+# still works as a heartbeat
+DASHBOARD_REFRESH_MAX_AGE = 300
+
+# A directory scanned within this long of its mtime may change again
+# without the mtime moving (coarse timestamps), so its scan is not reused
+DIR_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# Action file status lives in the YAML front matter at the top of the file
+STATUS_PEEK_BYTES = 4096
+_STATUS_PENDING = b'status: pending'
+_STATUS_IN_PROGRESS = b'status: in_progress'
+
+# Dashboard placeholders look like {{name}}
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Instructions handed to Claude for each action file, filled with str.format_map
+_PROMPT_TEMPLATE = '''
+You are an AI Employee assistant. Process the following action file and complete the task.
+
+Action file: {action_file}
+
+Instructions:
+1. Read the action file and understand what needs to be done
+2. Create a plan in /Plans/ folder if this is a multi-step task
+3. Execute the task step by step
+4. Update the Dashboard.md with progress
+5. When complete, move the action file to /Done/ folder
+6. Log your actions in /Logs/
+
+Remember:
+- Always ask for approval before sensitive actions (payments, external communications)
+- Log every action you take
+- Be transparent about what you're doing
+- If you need human approval, create a file in /Pending_Approval/
+
+Start processing now. Output your thought process and actions.
+'''
+
+# Markdown body of a plan file, filled with str.format_map
+_PLAN_TEMPLATE = '''---
+created: {created}
+status: in_progress
+source_file: {source_file}
+---
+
+# Plan for Processing: {source_file}
+
+## Objective
+Process the action file and complete the required task.
+
+## Steps
+- [x] Read action file
+- [ ] Analyze requirements
+- [ ] Execute required actions
+- [ ] Update Dashboard
+- [ ] Move to /Done when complete
+
+## Notes
+*Plan created by Orchestrator (Bronze Tier - Claude simulation)*
+'''
+
+
+@functools.lru_cache(maxsize=8)
+def _fmt(epoch_second: int, fmt: str) -> str:
+    """Format a timestamp, reused for every call in the same second."""
+    return datetime.fromtimestamp(epoch_second).strftime(fmt)
 
 
 class Orchestrator:
@@ -45,6 +127,14 @@ class Orchestrator:
         self.check_interval = check_interval
         self.running = False
         
+        # Set by folder events to start the next cycle early; _stop_event
+        # also ends the event thread
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        
+        # Serialises action-log appends from processing workers
+        self._log_lock = threading.Lock()
+        
         # Define folder paths
         self.inbox_folder = self.vault_path / 'Inbox'
         self.needs_action_folder = self.vault_path / 'Needs_Action'
@@ -54,30 +144,46 @@ class Orchestrator:
         self.done_folder = self.vault_path / 'Done'
         self.logs_folder = self.vault_path / 'Logs'
         self.briefings_folder = self.vault_path / 'Briefings'
+        self.state_folder = self.vault_path / 'scripts'
         
         # Ensure all folders exist
         for folder in [self.inbox_folder, self.needs_action_folder, self.plans_folder,
                        self.approved_folder, self.rejected_folder, self.done_folder,
-                       self.logs_folder, self.briefings_folder]:
+                       self.logs_folder, self.briefings_folder, self.state_folder]:
             folder.mkdir(parents=True, exist_ok=True)
         
         # Dashboard file
         self.dashboard_file = self.vault_path / 'Dashboard.md'
         
+        # Folder scan results keyed by (folder, kind) ->
+        # (dir mtime_ns, scan start time_ns, result)
+        self._dir_cache: Dict[Tuple[Path, str], Tuple[int, int, Any]] = {}
+        
+        # Last dashboard text we read or wrote, as (mtime_ns, content)
+        self._dashboard_cache: Optional[Tuple[int, str]] = None
+        
+        # Counts from the last dashboard write and when it happened (monotonic)
+        self._last_dashboard_values: Optional[Tuple[int, ...]] = None
+        self._last_dashboard_write = 0.0
+        
         # Setup logging
         self._setup_logging()
         
         # Track processed files to avoid duplicates
-        self.processed_files: set = set()
+        self._open_state_db()
         self._load_processed_files()
         
         # Claude Code configuration
         self.claude_command = os.environ.get('CLAUDE_COMMAND', 'claude')
         self.max_claude_iterations = int(os.environ.get('MAX_CLAUDE_ITERATIONS', '5'))
         
-        self.logger.info(f'Orchestrator initialized')
-        self.logger.info(f'Vault path: {self.vault_path}')
-        self.logger.info(f'Claude command: {self.claude_command}')
+        self.logger.info('Orchestrator initialized')
+        self.logger.info('Vault path: %s', self.vault_path)
+        self.logger.info('Claude command: %s', self.claude_command)
+        
+        self._claude_path: Optional[str] = None
+        self._claude_warned = False
+        self._resolve_claude()
     
     def _setup_logging(self):
         """Configure logging."""
@@ -92,68 +198,161 @@ class Orchestrator:
             ]
         )
         self.logger = logging.getLogger('Orchestrator')
+        
+        # basicConfig puts the root logger at INFO; keep watchfiles' per-event
+        # "N changes detected" lines (our own moves included) out of the log
+        logging.getLogger('watchfiles').setLevel(logging.WARNING)
+    
+    def _open_state_db(self):
+        """Open the SQLite state database (WAL mode, append-only saves)."""
+        self._db = open_state_db(self.state_folder / 'orchestrator_state.db')
     
     def _load_processed_files(self):
         """Load list of processed files from disk."""
-        state_file = self.vault_path / 'scripts' / 'orchestrator_state.json'
-        if state_file.exists():
-            try:
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
-                    self.processed_files = set(state.get('processed_files', []))
-            except Exception as e:
-                self.logger.warning(f'Could not load state: {e}')
-                self.processed_files = set()
-    
-    def _save_state(self):
-        """Save current state to disk."""
-        state_file = self.vault_path / 'scripts' / 'orchestrator_state.json'
+        self.processed_files = ProcessedIds(self._db)
         try:
-            state = {
-                'processed_files': list(self.processed_files),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            self.processed_files.load()
+            
+            # Fold in the JSON list written by older versions
+            legacy = load_legacy_state(self.state_folder / 'orchestrator_state.json', self.logger)
+            if legacy:
+                for file_id in legacy.get('processed_files', []):
+                    self.processed_files.add(file_id)
+                self._save_state()
         except Exception as e:
-            self.logger.error(f'Could not save state: {e}')
+            self.logger.warning('Could not load state: %s', e)
+    
+    def _save_state(self):
+        """Save processed files added since the last save."""
+        save_processed_ids(self._db, self.processed_files, self.logger)
+    
+    def _resolve_claude(self):
+        """Look up the Claude command on PATH, warning once while it is missing."""
+        self._claude_path = shutil.which(self.claude_command)
+        if self._claude_path is None and not self._claude_warned:
+            self.logger.warning('Claude command "%s" not found. Skipping processing.', self.claude_command)
+            self._claude_warned = True
+        elif self._claude_path is not None:
+            self._claude_warned = False
+    
+    def _iter_md(self, folder: Path) -> Iterator[os.DirEntry]:
+        """
+        Iterate the .md files directly inside a folder.
+        
+        Args:
+            folder: Folder to scan
+            
+        Yields:
+            DirEntry for each regular .md file
+        """
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False):
+                    yield entry
+    
+    def _cached_scan(self, folder: Path, kind: str, scan: Callable[[Path], Any]) -> Any:
+        """
+        Run a folder scan, reusing the last result while the folder is unchanged.
+        
+        A directory's mtime only moves when entries are added, removed or
+        renamed, so an idle tick costs one stat per folder. A scan that
+        started within DIR_MTIME_GRANULARITY_NS of the mtime is never
+        reused, since a later change in the same timestamp tick would
+        leave the mtime unchanged (the racy-git problem).
+        
+        Args:
+            folder: Folder to scan
+            kind: Name of the scan, so several scans can share a folder
+            scan: Callable computing the result from the folder
+            
+        Returns:
+            Result of scan(folder)
+        """
+        mtime_ns = folder.stat().st_mtime_ns
+        key = (folder, kind)
+        cached = self._dir_cache.get(key)
+        if (cached and cached[0] == mtime_ns
+                and cached[1] - mtime_ns >= DIR_MTIME_GRANULARITY_NS):
+            return cached[2]
+        
+        scanned_at_ns = time.time_ns()
+        result = scan(folder)
+        self._dir_cache[key] = (mtime_ns, scanned_at_ns, result)
+        return result
     
     def _count_files_in_folder(self, folder: Path) -> int:
         """Count .md files in a folder."""
         try:
-            return len([f for f in folder.iterdir() if f.suffix == '.md' and f.is_file()])
+            return self._cached_scan(folder, 'count', lambda f: sum(1 for _ in self._iter_md(f)))
         except Exception:
             return 0
     
-    def _get_today_completed_count(self) -> int:
+    def _get_done_entries(self) -> List[Tuple[str, float]]:
+        """List (name, mtime) for every .md file in Done."""
+        def scan(folder: Path) -> List[Tuple[str, float]]:
+            entries = []
+            for entry in self._iter_md(folder):
+                try:
+                    entries.append((entry.name, entry.stat().st_mtime))
+                except OSError:
+                    pass
+            return entries
+        
+        return self._cached_scan(self.done_folder, 'entries', scan)
+    
+    def _get_today_completed_count(self, now: Optional[datetime] = None) -> int:
         """Count files moved to Done today."""
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            count = 0
-            for f in self.done_folder.iterdir():
-                if f.suffix == '.md' and today in f.name:
-                    count += 1
-            return count
+            now = now or datetime.now()
+            today = _fmt(int(now.timestamp()), '%Y-%m-%d')
+            return sum(1 for name, _ in self._get_done_entries() if today in name)
         except Exception:
             return 0
     
-    def _get_week_completed_count(self) -> int:
+    def _get_week_completed_count(self, now: Optional[datetime] = None) -> int:
         """Count files moved to Done this week."""
         try:
-            week_ago = datetime.now() - timedelta(days=7)
-            count = 0
-            for f in self.done_folder.iterdir():
-                if f.suffix == '.md':
-                    try:
-                        mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                        if mtime >= week_ago:
-                            count += 1
-                    except Exception:
-                        pass
-            return count
+            week_ago = ((now or datetime.now()) - timedelta(days=7)).timestamp()
+            return sum(1 for _, mtime in self._get_done_entries() if mtime >= week_ago)
         except Exception:
             return 0
     
+    def _read_dashboard(self) -> str:
+        """
+        Read Dashboard.md, reusing our last copy while the file is unchanged.
+        
+        Returns:
+            Current dashboard text
+        """
+        mtime_ns = self.dashboard_file.stat().st_mtime_ns
+        if self._dashboard_cache and self._dashboard_cache[0] == mtime_ns:
+            return self._dashboard_cache[1]
+        
+        content = self.dashboard_file.read_text(encoding='utf-8')
+        self._dashboard_cache = (mtime_ns, content)
+        return content
+    
+    def _write_dashboard(self, content: str):
+        """
+        Atomically replace Dashboard.md.
+        
+        The text goes to a sibling temp file that is renamed over the
+        dashboard, so Obsidian never sees a half-written file.
+        
+        Args:
+            content: New dashboard text
+        """
+        tmp_file = self.dashboard_file.with_suffix('.md.tmp')
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.dashboard_file)
+    
     def update_dashboard(self):
         """
         Update the Dashboard.md with current status.
@@ -163,36 +362,51 @@ class Orchestrator:
                 self.logger.warning('Dashboard.md not found')
                 return
 
+            now = datetime.now()
+            last_sync = _fmt(int(now.timestamp()), '%Y-%m-%d %H:%M:%S')
+            
             # Count files in each folder
             inbox_count = self._count_files_in_folder(self.inbox_folder)
             needs_action_count = self._count_files_in_folder(self.needs_action_folder)
             pending_approval_count = self._count_files_in_folder(self.approved_folder)
             approved_count = self._count_files_in_folder(self.approved_folder)
             active_plans_count = self._count_files_in_folder(self.plans_folder)
-            completed_today = self._get_today_completed_count()
-            completed_this_week = self._get_week_completed_count()
+            completed_today = self._get_today_completed_count(now)
+            completed_this_week = self._get_week_completed_count(now)
+            
+            # Nothing to do if the counts are unchanged, nobody else has
+            # touched the file and the heartbeat is still fresh
+            values = (inbox_count, needs_action_count, pending_approval_count,
+                      approved_count, active_plans_count, completed_today,
+                      completed_this_week)
+            if (values == self._last_dashboard_values
+                    and self._dashboard_cache
+                    and self._dashboard_cache[0] == self.dashboard_file.stat().st_mtime_ns
+                    and time.monotonic() - self._last_dashboard_write < DASHBOARD_REFRESH_MAX_AGE):
+                return
 
-            # Read current dashboard with UTF-8 encoding
-            content = self.dashboard_file.read_text(encoding='utf-8')
+            # Read current dashboard
+            content = self._read_dashboard()
             
             # Update placeholders
             replacements = {
-                '{{pending_count}}': str(needs_action_count),
-                '{{active_plans_count}}': str(active_plans_count),
-                '{{completed_today}}': str(completed_today),
-                '{{completed_this_week}}': str(completed_this_week),
-                '{{inbox_count}}': str(inbox_count),
-                '{{needs_action_count}}': str(needs_action_count),
-                '{{pending_approval_count}}': str(pending_approval_count),
-                '{{approved_count}}': str(approved_count),
-                '{{watcher_status}}': 'Running',
-                '{{orchestrator_status}}': 'Running',
-                '{{last_sync}}': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                '{{timestamp}}': datetime.now().isoformat()
+                'pending_count': str(needs_action_count),
+                'active_plans_count': str(active_plans_count),
+                'completed_today': str(completed_today),
+                'completed_this_week': str(completed_this_week),
+                'inbox_count': str(inbox_count),
+                'needs_action_count': str(needs_action_count),
+                'pending_approval_count': str(pending_approval_count),
+                'approved_count': str(approved_count),
+                'watcher_status': 'Running',
+                'orchestrator_status': 'Running',
+                'last_sync': last_sync,
+                'timestamp': now.isoformat()
             }
             
-            for placeholder, value in replacements.items():
-                content = content.replace(placeholder, value)
+            # Single pass; unknown placeholders are left untouched
+            content = _PLACEHOLDER_RE.sub(
+                lambda m: replacements.get(m.group(1), m.group(0)), content)
             
             # Update dynamic values based on actual counts
             content = content.replace('| **Pending Actions** | 1 |', f'| **Pending Actions** | {needs_action_count} |')
@@ -201,15 +415,18 @@ class Orchestrator:
             content = content.replace('| **Tasks Completed This Week** | 3 |', f'| **Tasks Completed This Week** | {completed_this_week} |')
             content = content.replace('| /Needs_Action | 1 |', f'| /Needs_Action | {needs_action_count} |')
             content = content.replace('| /Approved | 1 |', f'| /Approved | {approved_count} |')
-            content = content.replace('| Last Sync | 2026-02-21 00:37:58 |', f'| Last Sync | {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} |')
+            content = content.replace('| Last Sync | 2026-02-21 00:37:58 |', f'| Last Sync | {last_sync} |')
 
             # Write updated dashboard with UTF-8 encoding
-            self.dashboard_file.write_text(content, encoding='utf-8')
+            self._write_dashboard(content)
+            self._dashboard_cache = (self.dashboard_file.stat().st_mtime_ns, content)
+            self._last_dashboard_values = values
+            self._last_dashboard_write = time.monotonic()
             
             self.logger.info('Dashboard updated successfully')
             
         except Exception as e:
-            self.logger.error(f'Error updating dashboard: {e}')
+            self.logger.error('Error updating dashboard: %s', e)
     
     def _log_action(self, action_type: str, details: Dict[str, Any], result: str = 'success'):
         """
@@ -221,34 +438,70 @@ class Orchestrator:
             result: 'success' or 'error'
         """
         try:
-            log_file = self.logs_folder / f'{datetime.now().strftime("%Y-%m-%d")}.json'
-            
-            # Load existing logs
-            logs = []
-            if log_file.exists():
-                try:
-                    with open(log_file, 'r') as f:
-                        logs = json.load(f)
-                except Exception:
-                    logs = []
+            now = datetime.now()
+            log_file = self.logs_folder / f'{_fmt(int(now.timestamp()), "%Y-%m-%d")}.jsonl'
             
             # Create new log entry
             log_entry = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'action_type': action_type,
                 'actor': 'orchestrator',
                 'parameters': details,
                 'result': result
             }
             
-            logs.append(log_entry)
-            
-            # Save logs
-            with open(log_file, 'w') as f:
-                json.dump(logs, f, indent=2)
+            # One JSON object per line; appending never rewrites earlier entries.
+            # The lock keeps lines from concurrent workers from interleaving.
+            line = json.dumps(log_entry, separators=(',', ':')) + '\n'
+            with self._log_lock, open(log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
                 
         except Exception as e:
-            self.logger.error(f'Error logging action: {e}')
+            self.logger.error('Error logging action: %s', e)
+    
+    def _read_logs(self, date: str) -> List[Dict[str, Any]]:
+        """
+        Read the action log entries for a day.
+        
+        Args:
+            date: Day in YYYY-MM-DD format
+            
+        Returns:
+            Log entries in the order they were written
+        """
+        log_file = self.logs_folder / f'{date}.jsonl'
+        if not log_file.exists():
+            # Days logged before the switch to JSONL
+            legacy_file = log_file.with_suffix('.json')
+            if legacy_file.exists():
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            return []
+        
+        with open(log_file, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    
+    def _list_md_by_mtime(self, folder: Path) -> List[Path]:
+        """
+        List .md files in a folder, oldest first.
+        
+        Args:
+            folder: Folder to list
+            
+        Returns:
+            File paths sorted by modification time
+        """
+        def scan(folder: Path) -> List[Path]:
+            items = []
+            for entry in self._iter_md(folder):
+                try:
+                    items.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+            items.sort()
+            return [Path(path) for _, path in items]
+        
+        return list(self._cached_scan(folder, 'sorted', scan))
     
     def get_pending_files(self) -> List[Path]:
         """
@@ -258,11 +511,9 @@ class Orchestrator:
             List of file paths in Needs_Action folder
         """
         try:
-            files = [f for f in self.needs_action_folder.iterdir() 
-                    if f.suffix == '.md' and f.is_file()]
-            return sorted(files, key=lambda f: f.stat().st_mtime)
+            return self._list_md_by_mtime(self.needs_action_folder)
         except Exception as e:
-            self.logger.error(f'Error getting pending files: {e}')
+            self.logger.error('Error getting pending files: %s', e)
             return []
     
     def get_approved_files(self) -> List[Path]:
@@ -273,13 +524,33 @@ class Orchestrator:
             List of file paths in Approved folder
         """
         try:
-            files = [f for f in self.approved_folder.iterdir() 
-                    if f.suffix == '.md' and f.is_file()]
-            return sorted(files, key=lambda f: f.stat().st_mtime)
+            return self._list_md_by_mtime(self.approved_folder)
         except Exception as e:
-            self.logger.error(f'Error getting approved files: {e}')
+            self.logger.error('Error getting approved files: %s', e)
             return []
     
+    def _mark_in_progress(self, action_file: Path):
+        """
+        Flip the front-matter status of an action file from pending to in_progress.
+        
+        Only the head of the file is read to look for the marker; when it is
+        found, the file is rewritten from the marker onward.
+        
+        Args:
+            action_file: Path to the action file
+        """
+        with open(action_file, 'r+b') as f:
+            head = f.read(STATUS_PEEK_BYTES)
+            # Stay inside the front matter so body text is never touched
+            end = head.find(b'\n---', 3) if head.startswith(b'---') else -1
+            pos = head.find(_STATUS_PENDING, 0, end if end >= 0 else len(head))
+            if pos < 0:
+                return
+            f.seek(pos + len(_STATUS_PENDING))
+            rest = f.read()
+            f.seek(pos)
+            f.write(_STATUS_IN_PROGRESS + rest)
+    
     def process_with_claude(self, action_file: Path) -> bool:
         """
         Process an action file with Claude Code.
@@ -291,89 +562,64 @@ class Orchestrator:
             True if processing succeeded, False otherwise
         """
         try:
-            self.logger.info(f'Processing with Claude: {action_file.name}')
+            self.logger.info('Processing with Claude: %s', action_file.name)
             
-            # Create a prompt file for Claude
-            prompt = f'''
-You are an AI Employee assistant. Process the following action file and complete the task.
-
-Action file: {action_file}
-
-Instructions:
-1. Read the action file and understand what needs to be done
-2. Create a plan in /Plans/ folder if this is a multi-step task
-3. Execute the task step by step
-4. Update the Dashboard.md with progress
-5. When complete, move the action file to /Done/ folder
-6. Log your actions in /Logs/
-
-Remember:
-- Always ask for approval before sensitive actions (payments, external communications)
-- Log every action you take
-- Be transparent about what you're doing
-- If you need human approval, create a file in /Pending_Approval/
-
-Start processing now. Output your thought process and actions.
-'''
+            # Check if claude command exists (resolved once per cycle, not per file)
+            if self._claude_path is None:
+                self._log_action('claude_process', {'file': str(action_file)}, 'skipped_claude_not_found')
+                return False
             
-            # Check if claude command exists
-            try:
-                result = subprocess.run(
-                    ['where', self.claude_command] if sys.platform == 'win32' else ['which', self.claude_command],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
-                    self.logger.warning(f'Claude command "{self.claude_command}" not found. Skipping processing.')
-                    self._log_action('claude_process', {'file': str(action_file)}, 'skipped_claude_not_found')
-                    return False
-            except Exception:
-                pass
+            # Create a prompt file for Claude
+            prompt = _PROMPT_TEMPLATE.format_map({'action_file': action_file})
             
             # For Bronze tier, we'll simulate Claude processing
             # In production, this would actually call Claude Code
-            self.logger.info(f'[SIMULATED] Claude would process: {action_file.name}')
+            self.logger.info('[SIMULATED] Claude would process: %s', action_file.name)
             
             # Create a plan file
-            plan_file = self.plans_folder / f'PLAN_{action_file.stem}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md'
-            plan_content = f'''---
-created: {datetime.now().isoformat()}
-status: in_progress
-source_file: {action_file.name}
----
-
-# Plan for Processing: {action_file.name}
-
-## Objective
-Process the action file and complete the required task.
-
-## Steps
-- [x] Read action file
-- [ ] Analyze requirements
-- [ ] Execute required actions
-- [ ] Update Dashboard
-- [ ] Move to /Done when complete
-
-## Notes
-*Plan created by Orchestrator (Bronze Tier - Claude simulation)*
-'''
+            now = datetime.now()
+            plan_file = self.plans_folder / f'PLAN_{action_file.stem}_{_fmt(int(now.timestamp()), "%Y%m%d_%H%M%S")}.md'
+            plan_content = _PLAN_TEMPLATE.format_map({
+                'created': now.isoformat(),
+                'source_file': action_file.name,
+            })
             plan_file.write_text(plan_content)
             
             # Update action file status
-            content = action_file.read_text()
-            if 'status: pending' in content:
-                content = content.replace('status: pending', 'status: in_progress')
-                action_file.write_text(content)
+            self._mark_in_progress(action_file)
             
             self._log_action('claude_process', {'file': str(action_file), 'plan': str(plan_file)}, 'success')
             
             return True
             
         except Exception as e:
-            self.logger.error(f'Error processing with Claude: {e}')
+            self.logger.error('Error processing with Claude: %s', e)
             self._log_action('claude_process', {'file': str(action_file), 'error': str(e)}, 'error')
             return False
     
+    def _process_pending(self, pending_files: List[Path]):
+        """
+        Process pending action files concurrently.
+        
+        Up to max_claude_iterations files are handled at once. Results are
+        collected on the calling thread, so processed_files is only ever
+        touched from the run loop.
+        
+        Args:
+            pending_files: Action files found in Needs_Action
+        """
+        # Skip if already processed
+        to_process = [f for f in pending_files if str(f) not in self.processed_files]
+        if not to_process:
+            return
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.max_claude_iterations),
+                                thread_name_prefix='Claude') as executor:
+            futures = {executor.submit(self.process_with_claude, f): f for f in to_process}
+            for future in as_completed(futures):
+                if future.result():
+                    self.processed_files.add(str(futures[future]))
+    
     def move_to_done(self, file_path: Path):
         """
         Move a completed file to the Done folder.
@@ -383,19 +629,47 @@ Process the action file and complete the required task.
         """
         try:
             dest = self.done_folder / file_path.name
-            shutil.move(str(file_path), str(dest))
-            self.logger.info(f'Moved to Done: {file_path.name}')
+            try:
+                # Same filesystem: a single atomic rename
+                os.replace(file_path, dest)
+            except OSError:
+                # Cross-device (e.g. Done/ on another mount): copy then unlink
+                shutil.move(str(file_path), str(dest))
+            
+            self.logger.info('Moved to Done: %s', file_path.name)
             self._log_action('move_to_done', {'file': str(file_path)}, 'success')
         except Exception as e:
-            self.logger.error(f'Error moving file to Done: {e}')
+            self.logger.error('Error moving file to Done: %s', e)
+    
+    def _watch_folders(self):
+        """Wake the run loop whenever Needs_Action or Approved changes."""
+        try:
+            for _ in watch(self.needs_action_folder, self.approved_folder,
+                           stop_event=self._stop_event, debounce=200, step=50,
+                           recursive=False):
+                self._wake.set()
+        except Exception as e:
+            self.logger.error('Folder watch failed, polling only: %s', e)
     
     def run(self):
         """
         Main orchestration loop.
+        
+        Each cycle runs immediately on a filesystem event when watchfiles is
+        installed; check_interval remains the upper bound between full scans.
         """
         self.running = True
+        self._stop_event.clear()
+        self._wake.clear()
         self.logger.info('Starting Orchestrator')
         
+        watcher_thread = None
+        if watch is not None:
+            watcher_thread = threading.Thread(target=self._watch_folders,
+                                              name='OrchestratorWatch', daemon=True)
+            watcher_thread.start()
+            self.logger.info('Using filesystem events (watchfiles)')
+        
         try:
             while self.running:
                 try:
@@ -406,23 +680,18 @@ Process the action file and complete the required task.
                     pending_files = self.get_pending_files()
                     
                     if pending_files:
-                        self.logger.info(f'Found {len(pending_files)} pending file(s)')
+                        self.logger.info('Found %d pending file(s)', len(pending_files))
+                        
+                        # Pick up a Claude install made while we were running
+                        if self._claude_path is None:
+                            self._resolve_claude()
                         
-                        for action_file in pending_files:
-                            # Skip if already processed
-                            if str(action_file) in self.processed_files:
-                                continue
-                            
-                            # Process with Claude
-                            success = self.process_with_claude(action_file)
-                            
-                            if success:
-                                self.processed_files.add(str(action_file))
+                        self._process_pending(pending_files)
                     
                     # Check for approved files (ready for action)
                     approved_files = self.get_approved_files()
                     if approved_files:
-                        self.logger.info(f'Found {len(approved_files)} approved file(s) ready for action')
+                        self.logger.info('Found %d approved file(s) ready for action', len(approved_files))
                         # In Bronze tier, just move to Done
                         for approved_file in approved_files:
                             self.move_to_done(approved_file)
@@ -431,15 +700,19 @@ Process the action file and complete the required task.
                     self._save_state()
                     
                 except Exception as e:
-                    self.logger.error(f'Error in orchestration cycle: {e}')
+                    self.logger.error('Error in orchestration cycle: %s', e)
                 
-                # Wait before next cycle
-                time.sleep(self.check_interval)
+                # Wait for a folder event or the next scheduled cycle
+                self._wake.wait(self.check_interval)
+                self._wake.clear()
                 
         except KeyboardInterrupt:
             self.logger.info('Orchestrator stopped by user')
         finally:
             self.running = False
+            self._stop_event.set()
+            if watcher_thread is not None:
+                watcher_thread.join(timeout=1)
             self._save_state()
             self.update_dashboard()
             self.logger.info('Orchestrator stopped')
@@ -447,6 +720,8 @@ Process the action file and complete the required task.
     def stop(self):
         """Stop the orchestrator."""
         self.running = False
+        self._stop_event.set()
+        self._wake.set()
         self.logger.info('Stop signal received')
 
 
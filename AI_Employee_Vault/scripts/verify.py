@@ -9,13 +9,66 @@ Usage:
     py scripts\verify.py [vault_path]
 """
 
+import os
+import re
 import sys
 import json
+import functools
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from typing import Dict
 
 
-def check_folder_structure(vault_path: Path) -> bool:
+# Dashboard placeholders look like {{name}}
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a UTF-8 text file once per run."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _list_dir(path: Path) -> Dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects in one readdir pass."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+@dataclass
+class VaultSnapshot:
+    """Directory listings of the vault root and scripts/, taken once per run."""
+    
+    vault_path: Path
+    root_entries: Dict[str, os.DirEntry]
+    scripts_entries: Dict[str, os.DirEntry]
+    
+    @classmethod
+    def take(cls, vault_path: Path) -> 'VaultSnapshot':
+        """Scan the vault root and its scripts folder."""
+        return cls(vault_path, _list_dir(vault_path), _list_dir(vault_path / 'scripts'))
+    
+    def has_dir(self, name: str) -> bool:
+        """Whether the vault root contains a folder with this name."""
+        entry = self.root_entries.get(name)
+        return entry is not None and entry.is_dir()
+    
+    def has_file(self, name: str) -> bool:
+        """Whether the vault root contains a file with this name."""
+        entry = self.root_entries.get(name)
+        return entry is not None and entry.is_file()
+    
+    def has_script(self, name: str) -> bool:
+        """Whether scripts/ contains a file with this name."""
+        entry = self.scripts_entries.get(name)
+        return entry is not None and entry.is_file()
+
+
+def check_folder_structure(snapshot: VaultSnapshot) -> bool:
     """Check that all required folders exist."""
     required_folders = [
         'Inbox',
@@ -33,8 +86,7 @@ def check_folder_structure(vault_path: Path) -> bool:
     
     all_exist = True
     for folder in required_folders:
-        folder_path = vault_path / folder
-        if folder_path.exists() and folder_path.is_dir():
+        if snapshot.has_dir(folder):
             print(f'  [OK] {folder}/')
         else:
             print(f'  [MISSING] {folder}/')
@@ -43,7 +95,7 @@ def check_folder_structure(vault_path: Path) -> bool:
     return all_exist
 
 
-def check_required_files(vault_path: Path) -> bool:
+def check_required_files(snapshot: VaultSnapshot) -> bool:
     """Check that all required files exist."""
     required_files = [
         'Dashboard.md',
@@ -56,8 +108,7 @@ def check_required_files(vault_path: Path) -> bool:
     
     all_exist = True
     for file in required_files:
-        file_path = vault_path / file
-        if file_path.exists() and file_path.is_file():
+        if snapshot.has_file(file):
             print(f'  [OK] {file}')
         else:
             print(f'  [MISSING] {file}')
@@ -66,7 +117,7 @@ def check_required_files(vault_path: Path) -> bool:
     return all_exist
 
 
-def check_scripts(vault_path: Path) -> bool:
+def check_scripts(snapshot: VaultSnapshot) -> bool:
     """Check that all required scripts exist and are valid Python."""
     required_scripts = [
         'base_watcher.py',
@@ -79,8 +130,7 @@ def check_scripts(vault_path: Path) -> bool:
     
     all_exist = True
     for script in required_scripts:
-        script_path = vault_path / 'scripts' / script
-        if script_path.exists() and script_path.is_file():
+        if snapshot.has_script(script):
             print(f'  [OK] scripts/{script}')
         else:
             print(f'  [MISSING] scripts/{script}')
@@ -89,8 +139,9 @@ def check_scripts(vault_path: Path) -> bool:
     return all_exist
 
 
-def check_python_syntax(vault_path: Path) -> bool:
+def check_python_syntax(snapshot: VaultSnapshot) -> bool:
     """Check Python syntax of all scripts."""
+    import compileall
     import py_compile
     
     scripts = [
@@ -102,8 +153,19 @@ def check_python_syntax(vault_path: Path) -> bool:
     
     all_valid = True
     for script in scripts:
-        script_path = vault_path / 'scripts' / script
+        # compile_file reports success for a path that doesn't exist
+        if not snapshot.has_script(script):
+            print(f'  [MISSING] {script} - cannot check syntax')
+            all_valid = False
+            continue
+        
+        script_path = snapshot.vault_path / 'scripts' / script
+        # compileall skips scripts whose cached .pyc is still current
+        if compileall.compile_file(str(script_path), quiet=2):
+            print(f'  [OK] {script} - syntax OK')
+            continue
         try:
+            # Recompile only to get the error details
             py_compile.compile(script_path, doraise=True)
             print(f'  [OK] {script} - syntax OK')
         except py_compile.PyCompileError as e:
@@ -119,24 +181,27 @@ def check_dashboard_template(vault_path: Path) -> bool:
     if not dashboard_path.exists():
         return False
     
-    content = dashboard_path.read_text(encoding='utf-8')
+    content = _read(str(dashboard_path))
     
     required_placeholders = [
-        '{{pending_count}}',
-        '{{needs_action_count}}',
-        '{{completed_today}}',
-        '{{completed_this_week}}',
-        '{{watcher_status}}',
-        '{{orchestrator_status}}',
-        '{{last_sync}}'
+        'pending_count',
+        'needs_action_count',
+        'completed_today',
+        'completed_this_week',
+        'watcher_status',
+        'orchestrator_status',
+        'last_sync'
     ]
     
+    # Collect every placeholder in one pass over the template
+    found = set(_PLACEHOLDER_RE.findall(content))
+    
     all_present = True
-    for placeholder in required_placeholders:
-        if placeholder in content:
-            print(f'  [OK] Placeholder: {placeholder}')
+    for name in required_placeholders:
+        if name in found:
+            print(f'  [OK] Placeholder: {{{{{name}}}}}')
         else:
-            print(f'  [MISSING] Placeholder: {placeholder}')
+            print(f'  [MISSING] Placeholder: {{{{{name}}}}}')
             all_present = False
     
     return all_present
@@ -148,7 +213,7 @@ def check_company_handbook(vault_path: Path) -> bool:
     if not handbook_path.exists():
         return False
     
-    content = handbook_path.read_text(encoding='utf-8')
+    content = _read(str(handbook_path))
     
     required_sections = [
         'Rules of Engagement',
@@ -158,9 +223,12 @@ def check_company_handbook(vault_path: Path) -> bool:
         'Human-in-the-Loop'
     ]
     
+    # Collect every section heading in one pass over the handbook
+    found = set(re.findall('|'.join(map(re.escape, required_sections)), content))
+    
     all_present = True
     for section in required_sections:
-        if section in content:
+        if section in found:
             print(f'  [OK] Section: {section}')
         else:
             print(f'  [MISSING] Section: {section}')
@@ -169,7 +237,7 @@ def check_company_handbook(vault_path: Path) -> bool:
     return all_present
 
 
-def check_sample_content(vault_path: Path) -> bool:
+def check_sample_content(snapshot: VaultSnapshot) -> bool:
     """Check that folders have sample content for demonstration."""
     print('\n--- Sample Content ---')
     
@@ -178,7 +246,7 @@ def check_sample_content(vault_path: Path) -> bool:
         'Needs_Action/*.md': 'Sample action file',
         'Plans/*.md': 'Sample plan',
         'Done/*.md': 'Sample completed task',
-        'Logs/*.json': 'Sample log entry',
+        'Logs/*.jsonl': 'Sample log entry',
         'Briefings/*.md': 'Sample briefing',
         'Invoices/*.md': 'Invoice template',
         'Accounting/*.md': 'Accounting record'
@@ -186,13 +254,22 @@ def check_sample_content(vault_path: Path) -> bool:
     
     all_present = True
     for pattern, description in checks.items():
-        folder = pattern.split('/')[0]
-        ext = '*' + pattern.split('.')[1] if '.' in pattern else '*'
-        files = list((vault_path / folder).glob(ext))
-        md_files = [f for f in files if f.suffix == '.md' or f.suffix == '.json']
+        folder, _, name_glob = pattern.partition('/')
+        suffix = name_glob.lstrip('*')
+        
+        # Stop at the first match; one readdir pass per existing folder
+        hit = None
+        if snapshot.has_dir(folder):
+            try:
+                with os.scandir(snapshot.vault_path / folder) as it:
+                    hit = next((e.name for e in it
+                                if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)),
+                               None)
+            except OSError:
+                pass
         
-        if md_files:
-            print(f'  [OK] {description}: {md_files[0].name}')
+        if hit:
+            print(f'  [OK] {description}: {hit}')
         else:
             print(f'  [EMPTY] {description} in {folder}/')
             all_present = False
@@ -220,19 +297,19 @@ def run_test_workflow(vault_path: Path) -> bool:
     return True
 
 
-def check_bronze_tier_requirements(vault_path: Path) -> bool:
+def check_bronze_tier_requirements(snapshot: VaultSnapshot) -> bool:
     """Check official Bronze Tier requirements from hackathon document."""
     print('\n--- Bronze Tier Requirements ---')
     
     requirements = [
-        ('Dashboard.md exists', (vault_path / 'Dashboard.md').exists()),
-        ('Company_Handbook.md exists', (vault_path / 'Company_Handbook.md').exists()),
-        ('File System Watcher script', (vault_path / 'scripts' / 'filesystem_watcher.py').exists()),
-        ('Claude Code integration (orchestrator)', (vault_path / 'scripts' / 'orchestrator.py').exists()),
-        ('Folder: /Inbox', (vault_path / 'Inbox').exists()),
-        ('Folder: /Needs_Action', (vault_path / 'Needs_Action').exists()),
-        ('Folder: /Done', (vault_path / 'Done').exists()),
-        ('Agent Skill (SKILL.md)', (vault_path / 'scripts' / 'SKILL.md').exists()),
+        ('Dashboard.md exists', snapshot.has_file('Dashboard.md')),
+        ('Company_Handbook.md exists', snapshot.has_file('Company_Handbook.md')),
+        ('File System Watcher script', snapshot.has_script('filesystem_watcher.py')),
+        ('Claude Code integration (orchestrator)', snapshot.has_script('orchestrator.py')),
+        ('Folder: /Inbox', snapshot.has_dir('Inbox')),
+        ('Folder: /Needs_Action', snapshot.has_dir('Needs_Action')),
+        ('Folder: /Done', snapshot.has_dir('Done')),
+        ('Agent Skill (SKILL.md)', snapshot.has_script('SKILL.md')),
     ]
     
     all_met = True
@@ -264,26 +341,29 @@ def main():
         print(f'ERROR: Vault path does not exist: {vault_path}')
         sys.exit(1)
     
+    # List the vault root and scripts/ once for all existence checks
+    snapshot = VaultSnapshot.take(vault_path)
+    
     all_passed = True
     
     # Check folder structure
     print('\n--- Folder Structure ---')
-    if not check_folder_structure(vault_path):
+    if not check_folder_structure(snapshot):
         all_passed = False
     
     # Check required files
     print('\n--- Required Files ---')
-    if not check_required_files(vault_path):
+    if not check_required_files(snapshot):
         all_passed = False
     
     # Check scripts
     print('\n--- Scripts ---')
-    if not check_scripts(vault_path):
+    if not check_scripts(snapshot):
         all_passed = False
     
     # Check Python syntax
     print('\n--- Python Syntax ---')
-    if not check_python_syntax(vault_path):
+    if not check_python_syntax(snapshot):
         all_passed = False
     
     # Check dashboard template
@@ -297,11 +377,11 @@ def main():
         all_passed = False
     
     # Check sample content
-    if not check_sample_content(vault_path):
+    if not check_sample_content(snapshot):
         all_passed = False
     
     # Check Bronze Tier requirements
-    if not check_bronze_tier_requirements(vault_path):
+    if not check_bronze_tier_requirements(snapshot):
         all_passed = False
     
     # Run test workflow